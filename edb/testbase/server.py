@@ -62,6 +62,7 @@ import unittest
 import urllib
 
 import edgedb
+import uvloop
 
 from edb.edgeql import quote as qlquote
 from edb.server import args as edgedb_args
@@ -239,7 +240,7 @@ class TestCase(unittest.TestCase, metaclass=TestCaseMeta):
 
     @classmethod
     def setUpClass(cls):
-        loop = asyncio.new_event_loop()
+        loop = cls.new_event_loop()
         asyncio.set_event_loop(loop)
         cls.loop = loop
 
@@ -248,6 +249,10 @@ class TestCase(unittest.TestCase, metaclass=TestCaseMeta):
         cls.loop.close()
         asyncio.set_event_loop(None)
 
+    @classmethod
+    def new_event_loop(cls) -> asyncio.AbstractEventLoop:
+        return asyncio.new_event_loop()
+
     @classmethod
     def uses_server(cls) -> bool:
         return True
@@ -712,6 +717,23 @@ async def drop_db(conn, dbname):
     await conn.execute(f'DROP DATABASE {dbname}')
 
 
+@functools.cache
+def _read_script_file_cached(path: str, mtime_ns: int) -> str:
+    with open(path, 'rt') as f:
+        return f.read()
+
+
+def _read_script_file(path: str | pathlib.Path) -> str:
+    # The runner process calls get_setup_script() for every case, both
+    # from get_test_cases_setup() and again from setup_test_cases(), and
+    # setup_and_connect() may call it twice more.  Schema files like
+    # issues.esdl are also shared by many test classes.  The cache is
+    # per process, so workers each read a file once.  The mtime is part
+    # of the key so that edits made during a session are picked up.
+    path = os.fspath(path)
+    return _read_script_file_cached(path, os.stat(path).st_mtime_ns)
+
+
 class ClusterTestCase(BaseHTTPTestCase):
 
     BASE_TEST_CLASS = True
@@ -1278,8 +1300,7 @@ class DatabaseTestCase(ConnectedTestCase):
 
                 schema_fn = getattr(cls, name)
                 if schema_fn is not None:
-                    with open(schema_fn, 'r') as sf:
-                        module = sf.read()
+                    module = _read_script_file(schema_fn)
 
                     schema.append(f'\nmodule {module_name} {{ {module} }}')
 
@@ -1306,8 +1327,7 @@ class DatabaseTestCase(ConnectedTestCase):
                 )
 
                 if is_path:
-                    with open(scr, 'rt') as f:
-                        setup_text = f.read()
+                    setup_text = _read_script_file(scr)
                 else:
                     assert isinstance(scr, str)
                     setup_text = scr
@@ -1374,6 +1394,10 @@ class QueryTestCase(BaseQueryTestCase):
 
     BASE_TEST_CLASS = True
 
+    @classmethod
+    def new_event_loop(cls) -> asyncio.AbstractEventLoop:
+        return uvloop.new_event_loop()
+
 
 class SQLQueryTestCase(BaseQueryTestCase):
 
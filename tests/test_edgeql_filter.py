@@ -17,11 +17,15 @@
 #
 
 
+import datetime
 import os.path
 
 from edb.testbase import server as tb
 
 
+_DUE_DATE = datetime.datetime(2020, 1, 15, tzinfo=datetime.timezone.utc)
+
+
 class TestEdgeQLFilter(tb.QueryTestCase):
     """The test DB is designed to test certain non-trivial FILTER clauses.
     """
@@ -42,8 +46,7 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                     User.<owner[IS Issue].time_estimate > 9000
                     AND
                     User.<owner[IS Issue].due_date =
-                        <datetime>'2020-01-15T00:00:00+00:00'
-                ORDER BY User.name;
+                        <datetime>'2020-01-15T00:00:00+00:00';
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
@@ -64,19 +67,21 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                             NOT (
                                 NOT (
                                     EXISTS I.time_estimate AND
-                                    I.time_estimate > 9000
+                                    I.time_estimate > <int64>$est
                                 ) OR
                                 NOT (
                                     EXISTS I.due_date
-                                    AND I.due_date =
-                                        <datetime>'2020-01-15T00:00:00+00:00'
+                                    AND I.due_date = <datetime>$due
                                 )
                             )
-                    )
-                ORDER BY User.name;
+                    );
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
+            variables=dict(
+                est=9000,
+                due=_DUE_DATE,
+            ),
         )
 
     async def test_edgeql_filter_two_scalar_conditions03(self):
@@ -94,15 +99,17 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                             NOT (
                                 NOT EXISTS I.time_estimate OR
                                 NOT EXISTS I.due_date OR
-                                I.time_estimate <= 9000 OR
-                                I.due_date !=
-                                    <datetime>'2020-01-15T00:00:00+00:00'
+                                I.time_estimate <= <int64>$est OR
+                                I.due_date != <datetime>$due
                             )
-                    )
-                ORDER BY User.name;
+                    );
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
+            variables=dict(
+                est=9000,
+                due=_DUE_DATE,
+            ),
         )
 
     async def test_edgeql_filter_two_scalar_conditions04(self):
@@ -118,18 +125,24 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                 SELECT User{name}
                 FILTER
                     NOT (
-                        NOT EXISTS (User.<owner[IS Issue].time_estimate > 9000)
+                        NOT EXISTS (
+                            User.<owner[IS Issue].time_estimate > <int64>$est
+                        )
                         OR
-                        NOT EXISTS (U2.<owner[IS Issue].due_date =
-                            <datetime>'2020-01-15T00:00:00+00:00')
+                        NOT EXISTS (
+                            U2.<owner[IS Issue].due_date = <datetime>$due
+                        )
                     )
                     AND
                     # making sure it's the same Issue in both sub-clauses
-                    User.<owner[IS Issue] = U2.<owner[IS Issue]
-                ORDER BY User.name;
+                    User.<owner[IS Issue] = U2.<owner[IS Issue];
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
+            variables=dict(
+                est=9000,
+                due=_DUE_DATE,
+            ),
         )
 
     async def test_edgeql_filter_not_exists01(self):
@@ -138,8 +151,7 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                 # Find Users who do not have any Issues with time_estimate
                 SELECT User{name}
                 FILTER
-                    NOT EXISTS User.<owner[IS Issue].time_estimate
-                ORDER BY User.name;
+                    NOT EXISTS User.<owner[IS Issue].time_estimate;
             ''',
             # Only such user is Victor, who has no Issues at all.
             [{'name': 'Victor'}],
@@ -214,8 +226,7 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                             I := User.<owner[IS Issue]
                         FILTER
                             EXISTS I.time_estimate AND EXISTS I.due_date
-                    )
-                ORDER BY User.name;
+                    );
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
@@ -238,8 +249,7 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                                 NOT EXISTS I.time_estimate OR
                                 NOT EXISTS I.due_date
                             )
-                    )
-                ORDER BY User.name;
+                    );
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
@@ -264,8 +274,7 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                     )
                     AND
                     # making sure it's the same Issue in both sub-clauses
-                    User.<owner[IS Issue] = U2.<owner[IS Issue]
-                ORDER BY User.name;
+                    User.<owner[IS Issue] = U2.<owner[IS Issue];
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
@@ -294,8 +303,7 @@ class TestEdgeQLFilter(tb.QueryTestCase):
                                      FILTER I = U2.<owner[IS Issue]).due_date
                                 )
                             )
-                    )
-                ORDER BY User.name;
+                    );
             ''',
             # Only one Issue satisfies this and its owner is Yury.
             [{'name': 'Yury'}],
@@ -496,3 +504,13 @@ class TestEdgeQLFilter(tb.QueryTestCase):
             ''',
             [],
         )
+
+    async def test_edgeql_filter_aggregate07(self):
+        await self.assert_query_result(
+            r'''
+                # same as aggregate05, but the filtered set comes from
+                # the OpenIssue alias defined in the setup script
+                SELECT count(OpenIssue);
+            ''',
+            [3],
+        )